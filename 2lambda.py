@@ -14,11 +14,16 @@ def lambda_handler(event, context):
     amount      = quantity * unitPrice
  
     #4 Format and return the result
-    return {
+    result = {
         'TransactionID' :   transactionId,
         'ProductName'   :   productName,
         'Amount'        :   amount
     }
+
+    #5 Log the result here, the parent invokes us asynchronously
+    #  and no longer receives the response payload
+    print(json.dumps(result))
+    return result
  
 #########################################################################
 # No need to include the following snippet into the lambda function
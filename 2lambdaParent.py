@@ -1,5 +1,6 @@
 import json
 import boto3
+from concurrent.futures import ThreadPoolExecutor
  
 # Define the client to interact with AWS Lambda
 client = boto3.client('lambda')
@@ -14,16 +15,28 @@ def lambda_handler(event,context):
         "UnitPrice"     : 499
     }
  
-    response = client.invoke(
-        FunctionName = 'arn:aws:lambda:us-west-2:396639489761:function:db-2lambda',
-        InvocationType = 'RequestResponse',
-        Payload = json.dumps(inputParams)
-    )
-    response2 = client.invoke(
-        FunctionName = "arn:aws:lambda:us-west-2:396639489761:function:lambda2sns",
-        InvocationType = "Event"
-    )
-    responseFromChild = json.load(response['Payload'])
+    # Child functions to invoke, as (FunctionName, Payload) pairs
+    children = [
+        ('arn:aws:lambda:us-west-2:396639489761:function:db-2lambda', json.dumps(inputParams)),
+        ("arn:aws:lambda:us-west-2:396639489761:function:lambda2sns", None)
+    ]
  
-    print('\n')
-    print(responseFromChild)
+    # Invoke asynchronously so the parent does not sit idle (and get
+    # billed) while the child runs; the child's result is not consumed here.
+    # The invocations are issued concurrently so the parent waits for the
+    # slowest round-trip instead of the sum of all of them
+    with ThreadPoolExecutor(max_workers=len(children)) as executor:
+        futures = [
+            executor.submit(invoke_child, functionName, payload)
+            for functionName, payload in children
+        ]
+        responses = [future.result() for future in futures]
+ 
+def invoke_child(functionName, payload):
+    params = {
+        'FunctionName'   : functionName,
+        'InvocationType' : 'Event'
+    }
+    if payload is not None:
+        params['Payload'] = payload
+    return client.invoke(**params)